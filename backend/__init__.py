@@ -15,7 +15,7 @@ from .imaging import ImagingWorker
 # Utilities
 from .config import AppConfig
 from .logging_config import setup_logging, get_logger
-from .disk_list import list_disks
+from .disk_list import list_disks, clear_disk_list_cache
 from .admin import is_admin, require_admin
 from .cleanup import cleanup_qemu_files, cleanup_sevenzip_files, cleanup_all_tools
 from .validation import (
@@ -51,7 +51,7 @@ __all__ = [
     
     # Utilities
     'AppConfig', 'setup_logging', 'get_logger', 'list_disks',
-    'is_admin', 'require_admin', 'cleanup_qemu_files',
+    'clear_disk_list_cache', 'is_admin', 'require_admin', 'cleanup_qemu_files',
     'cleanup_sevenzip_files', 'cleanup_all_tools',
     
     # Validation
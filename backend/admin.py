@@ -1,23 +1,27 @@
 """
 Utilities for checking administrative privileges.
 """
+import functools
 import os
-import platform
 import logging
 
+from .constants import PLATFORM_SYSTEM
 from .exceptions import PermissionError as DiskImagePermissionError
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
 def is_admin() -> bool:
     """
     Check if the current process has administrative/root privileges.
     
+    The answer is fixed for the life of the process, so it is computed once.
+    
     Returns:
         True if running with admin/root privileges, False otherwise
     """
-    system = platform.system()
+    system = PLATFORM_SYSTEM
     
     try:
         if system == "Windows":
@@ -74,8 +78,7 @@ def require_admin() -> None:
         DiskImagePermissionError: If not running with admin privileges
     """
     if not is_admin():
-        system = platform.system()
-        if system == "Windows":
+        if PLATFORM_SYSTEM == "Windows":
             msg = "Administrator privileges required. Please run as administrator."
         else:
             msg = "Root privileges required. Please run with sudo."
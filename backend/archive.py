@@ -1,11 +1,13 @@
 """
 Archive management for disk images.
 """
+import shutil
 import zipfile
 import logging
 from pathlib import Path
 from typing import Tuple, Optional
 
+from .constants import ARCHIVE_COPY_CHUNK_SIZE
 from .sevenzip import SevenZipManager
 from .exceptions import ArchiveError
 from .validation import validate_archive_format
@@ -84,7 +86,7 @@ class ArchiveManager:
     
     def _create_zip_archive(self, source: Path, archive_path: Path) -> bool:
         """
-        Create a ZIP archive using Python's zipfile module.
+        Create a ZIP archive.
         
         Args:
             source: Source file path
@@ -95,7 +97,11 @@ class ArchiveManager:
         """
         try:
             with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
-                zf.write(source, source.name)
+                # ZipFile.write() copies in 8 KiB pieces; stream large chunks instead
+                zinfo = zipfile.ZipInfo.from_file(source, source.name)
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                with open(source, 'rb') as src, zf.open(zinfo, 'w', force_zip64=True) as dest:
+                    shutil.copyfileobj(src, dest, ARCHIVE_COPY_CHUNK_SIZE)
             
             logger.debug(f"ZIP archive created: {archive_path}")
             return True
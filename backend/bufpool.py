@@ -0,0 +1,71 @@
+"""
+Pool of page-aligned I/O buffers shared by imaging jobs.
+
+Buffers are anonymous mmap regions, so they are page-aligned and suitable for
+O_DIRECT. Released buffers are kept for reuse by the next job of the same size
+and unmapped once the pool has been idle for BUFFER_POOL_IDLE_SECONDS.
+"""
+import logging
+import mmap
+import threading
+from typing import Dict, List, Optional
+
+from .constants import BUFFER_POOL_IDLE_SECONDS, BUFFER_POOL_MAX_FREE
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_free: Dict[int, List[mmap.mmap]] = {}
+_reclaim_timer: Optional[threading.Timer] = None
+
+
+def acquire(size: int) -> mmap.mmap:
+    """
+    Get a page-aligned buffer of exactly size bytes.
+
+    Args:
+        size: Buffer size in bytes
+
+    Returns:
+        A pooled buffer if one of this size is free, otherwise a new one
+    """
+    with _lock:
+        free = _free.get(size)
+        if free:
+            return free.pop()
+    return mmap.mmap(-1, size)
+
+
+def release(buf: mmap.mmap) -> None:
+    """
+    Return a buffer obtained from acquire() to the pool.
+
+    Args:
+        buf: Buffer to return; it must not be used by the caller afterwards
+    """
+    global _reclaim_timer
+    with _lock:
+        free = _free.setdefault(len(buf), [])
+        if len(free) >= BUFFER_POOL_MAX_FREE:
+            buf.close()
+        else:
+            free.append(buf)
+        # Restart the idle countdown on every release
+        if _reclaim_timer is not None:
+            _reclaim_timer.cancel()
+        _reclaim_timer = threading.Timer(BUFFER_POOL_IDLE_SECONDS, clear)
+        _reclaim_timer.daemon = True
+        _reclaim_timer.start()
+
+
+def clear() -> None:
+    """Unmap every free buffer in the pool."""
+    global _reclaim_timer
+    with _lock:
+        buffers = [buf for free in _free.values() for buf in free]
+        _free.clear()
+        _reclaim_timer = None
+    for buf in buffers:
+        buf.close()
+    if buffers:
+        logger.debug("Released %d idle I/O buffers", len(buffers))
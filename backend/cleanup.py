@@ -71,12 +71,12 @@ def _cleanup_directory(directory: Path, tool_name: str) -> bool:
                 try:
                     file_path.unlink()
                     files_removed += 1
-                    logger.debug(f"Removed {tool_name} file: {file_path.name}")
+                    logger.debug("Removed %s file: %s", tool_name, file_path.name)
                 except Exception as e:
                     logger.warning(f"Failed to remove {tool_name} file {file_path.name}: {e}")
                     success = False
             elif file_path.is_dir():
-                logger.debug(f"Skipping {tool_name} subdirectory: {file_path.name}")
+                logger.debug("Skipping %s subdirectory: %s", tool_name, file_path.name)
         
         logger.info(f"{tool_name} cleanup completed - removed {files_removed} files")
         
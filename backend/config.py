@@ -6,9 +6,11 @@ from pathlib import Path
 from typing import Tuple, Optional, Any
 import json
 import logging
+import os
 
 from .constants import DEFAULT_CONFIG, CONFIG_FILE
 from .exceptions import ConfigError
+from . import jsonio
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,7 @@ class AppConfig:
     theme: str = "auto"
     window_size: Tuple[int, int] = (1024, 768)
     buffer_size_mb: int = 64
+    use_qt_dialog: bool = False  # Qt's own file dialog; avoids slow native share enumeration
 
     @classmethod
     def load(cls, config_path: Optional[Path] = None) -> 'AppConfig':
@@ -46,8 +49,7 @@ class AppConfig:
             return config
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = jsonio.loads(config_path.read_bytes())
             
             # Merge with defaults for missing keys
             merged_data = DEFAULT_CONFIG.copy()
@@ -81,7 +83,8 @@ class AppConfig:
                 last_output_dir=str(merged_data.get('last_output_dir', "")),
                 theme=str(merged_data.get('theme', "auto")),
                 window_size=window_size,
-                buffer_size_mb=buffer_size
+                buffer_size_mb=buffer_size,
+                use_qt_dialog=bool(merged_data.get('use_qt_dialog', False))
             )
             
         except (json.JSONDecodeError, TypeError, ValueError) as e:
@@ -94,6 +97,8 @@ class AppConfig:
         """
         Save configuration to file.
         
+        The file is left untouched if its contents would not change.
+        
         Args:
             config_path: Path to save config, defaults to CONFIG_FILE
             
@@ -111,8 +116,20 @@ class AppConfig:
             if isinstance(data.get('window_size'), tuple):
                 data['window_size'] = list(data['window_size'])
                 
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            content = jsonio.dumps_indented(data)
+            
+            # Most saves (e.g. on window close) change nothing; skip the rewrite
+            try:
+                if config_path.read_bytes() == content:
+                    logger.debug(f"Configuration unchanged, not rewriting {config_path}")
+                    return
+            except OSError:
+                pass
+            
+            # Write a sibling file and swap it in so a crash never leaves a truncated config
+            tmp_path = config_path.with_name(config_path.name + '.tmp')
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, config_path)
                 
             logger.debug(f"Configuration saved to {config_path}")
             
@@ -1,13 +1,33 @@
 """
 Constants and configuration values for DiskImage application.
 """
+import platform
 from pathlib import Path
 from typing import List
 
+# Operating system name as reported by platform.system(), resolved once at import
+PLATFORM_SYSTEM = platform.system()
+
 # File sizes
 BYTES_PER_MB = 1024 * 1024
 BYTES_PER_GB = 1024 * 1024 * 1024
 DEFAULT_BUFFER_SIZE = 64 * BYTES_PER_MB
+MIN_BUFFER_SIZE = 256 * 1024  # Smaller buffers cost more syscalls per GB than they save
+BUFFER_ALIGNMENT = 4096  # Buffer sizes are whole multiples of the page/sector size
+
+# Third-party downloads
+DOWNLOAD_CHUNK_SIZE = 1 * BYTES_PER_MB
+DOWNLOAD_LOG_INTERVAL = 8 * BYTES_PER_MB
+
+# Chunk size used when streaming an image into a ZIP archive with zipfile
+ARCHIVE_COPY_CHUNK_SIZE = 4 * BYTES_PER_MB
+
+# Imaging I/O buffer pool
+BUFFER_POOL_IDLE_SECONDS = 60  # Unmap free buffers after this long without use
+BUFFER_POOL_MAX_FREE = 1  # Free buffers kept per size
+
+# Seconds a list_disks() result is reused before the disks are enumerated again
+DISK_LIST_CACHE_TTL = 2.0
 
 # Windows error codes
 WINDOWS_DLL_NOT_FOUND = 3221225781
@@ -31,6 +51,8 @@ QEMU_DIR = TOOLS_DIR / "qemu"
 SEVENZIP_DIR = TOOLS_DIR / "7zip"
 CONFIG_FILE = PROJECT_ROOT / "config.json"
 LOG_FILE = PROJECT_ROOT / "diskimager_main.log"
+LOG_MAX_BYTES = 10 * BYTES_PER_MB  # Rotate the log file at this size
+LOG_BACKUP_COUNT = 3  # Rotated log files kept
 
 # Supported image formats
 SUPPORTED_IMAGE_FORMATS = {
@@ -48,13 +70,17 @@ SUPPORTED_ARCHIVE_FORMATS = ["zip", "7z"]
 SPARSE_FORMATS = {"qcow2", "vhd", "vmdk"}
 COMPRESSIBLE_FORMATS = {"qcow2", "vmdk"}
 
+# Raw formats that can be written with a plain byte-for-byte copy
+RAW_FORMATS = {"img", "iso"}
+
 # Default configuration
 DEFAULT_CONFIG: dict[str, object] = {
     "cleanup_tools": True,
     "last_output_dir": "",
     "theme": "auto",
     "window_size": [1024, 768],
-    "buffer_size_mb": 64
+    "buffer_size_mb": 64,
+    "use_qt_dialog": False
 }
 
 # Archive preferences (.zip > .7z > .exe for QEMU)
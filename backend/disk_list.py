@@ -2,35 +2,95 @@
 Cross-platform disk listing utilities for the disk imaging app.
 
 Provides functions to enumerate available disks on the system, 
-with Windows-specific implementations using WMIC and PowerShell.
+with Windows-specific implementations using WMI (in-process via pywin32),
+WMIC and PowerShell.
 """
-import platform
+import csv
+import io
 import subprocess
 import logging
 import json
-from typing import List, Dict, Optional
+import threading
+import time
+from typing import List, Dict, Optional, Any
 
+from .constants import DISK_LIST_CACHE_TTL, PLATFORM_SYSTEM
 from .exceptions import DiskListError
+from . import jsonio
+
+try:
+    import pythoncom
+    import win32com.client
+    HAS_WIN32COM = True
+except ImportError:
+    HAS_WIN32COM = False
 
 logger = logging.getLogger(__name__)
 
+# WMI connections are COM objects bound to the thread that created them
+_wmi_local = threading.local()
+
+# MSFT_PhysicalDisk.MediaType values worth showing (0 is "Unspecified")
+_MEDIA_TYPES = {3: 'HDD', 4: 'SSD', 5: 'SCM'}
+
+# Last list_disks() result as (monotonic timestamp, disks)
+_cache_lock = threading.Lock()
+_cached: Optional[tuple] = None
 
-def list_disks() -> List[Dict[str, str]]:
+
+def list_disks() -> List[Dict[str, Any]]:
     """
     Return a list of available disks on the system (platform-specific).
     
+    Enumeration spawns WMIC/PowerShell on Windows, so the result is reused for
+    DISK_LIST_CACHE_TTL seconds. Call clear_disk_list_cache() to force a
+    fresh enumeration, e.g. when the user asks for a refresh.
+    
     Returns:
         List of dictionaries containing disk information:
         - name: Human-readable disk name
         - device_id: System device identifier  
         - model: Disk model name
         - size: Formatted size string
+        - size_bytes: Size in bytes (0 if unknown)
+        - interface: Interface type, e.g. 'SCSI' or 'USB'
+        - media_type: 'HDD', 'SSD' or 'SCM' when known (WMI only)
+    
+    Raises:
+        DiskListError: If disk enumeration fails completely
+    """
+    global _cached
+    with _cache_lock:
+        cached = _cached
+    if cached is not None and time.monotonic() - cached[0] < DISK_LIST_CACHE_TTL:
+        logger.debug('Using cached disk list')
+        return list(cached[1])
     
+    disks = _enumerate_disks()
+    with _cache_lock:
+        _cached = (time.monotonic(), disks)
+    return list(disks)
+
+
+def clear_disk_list_cache() -> None:
+    """Drop the cached list_disks() result so the next call re-enumerates."""
+    global _cached
+    with _cache_lock:
+        _cached = None
+
+
+def _enumerate_disks() -> List[Dict[str, Any]]:
+    """
+    Helper: Enumerate disks for the current platform, bypassing the cache.
+    
+    Returns:
+        List of disk information dictionaries
+        
     Raises:
         DiskListError: If disk enumeration fails completely
     """
     logger.debug('Listing system disks')
-    system = platform.system()
+    system = PLATFORM_SYSTEM
     
     try:
         if system == "Windows":
@@ -51,16 +111,25 @@ def list_disks() -> List[Dict[str, str]]:
         raise DiskListError(f"Failed to enumerate system disks: {e}") from e
 
 
-def _list_disks_windows() -> List[Dict[str, str]]:
+def _list_disks_windows() -> List[Dict[str, Any]]:
     """
-    Use WMIC or PowerShell to enumerate physical disks on Windows.
+    Use WMI, WMIC or PowerShell to enumerate physical disks on Windows.
+    
+    The in-process WMI query is tried first when pywin32 is installed, since
+    it avoids spawning a child process.
     
     Returns:
         List of disk information dictionaries
         
     Raises:
-        DiskListError: If both WMIC and PowerShell fail
+        DiskListError: If WMIC and PowerShell both fail
     """
+    if HAS_WIN32COM:
+        try:
+            return _list_disks_wmi()
+        except Exception as e:
+            logger.warning(f"WMI query failed: {e}, falling back to WMIC")
+    
     logger.debug('Attempting to list Windows disks with WMIC')
     
     try:
@@ -73,7 +142,108 @@ def _list_disks_windows() -> List[Dict[str, str]]:
         return _list_disks_powershell()
 
 
-def _list_disks_wmic() -> List[Dict[str, str]]:
+def _format_size(size_bytes: int) -> str:
+    """
+    Helper: Format a byte count as GB with two decimals, using integer math only.
+    
+    Args:
+        size_bytes: Size in bytes, 0 if unknown
+        
+    Returns:
+        Size string such as '465.76 GB', or 'Unknown' for 0
+    """
+    if size_bytes <= 0:
+        return 'Unknown'
+    # Hundredths of a GiB, rounded half up
+    gb_x100 = (size_bytes * 100 + (1 << 29)) >> 30
+    return f"{gb_x100 // 100}.{gb_x100 % 100:02d} GB"
+
+
+def _wmi_service(namespace: str = "root\\cimv2") -> Any:
+    """
+    Helper: Return this thread's cached WMI connection, creating it on first use.
+    
+    Args:
+        namespace: WMI namespace to connect to
+        
+    Returns:
+        SWbemServices COM object for the namespace
+    """
+    services = getattr(_wmi_local, 'services', None)
+    if services is None:
+        pythoncom.CoInitialize()
+        services = _wmi_local.services = {}
+    service = services.get(namespace)
+    if service is None:
+        service = win32com.client.GetObject(f"winmgmts:\\\\.\\{namespace}")
+        services[namespace] = service
+    return service
+
+
+def _physical_disk_media_types() -> Dict[int, str]:
+    """
+    Helper: Map disk numbers to media types from MSFT_PhysicalDisk.
+    
+    Returns:
+        Dictionary of disk number to 'HDD'/'SSD'/'SCM'; empty if the Storage
+        namespace is unavailable (e.g. before Windows 8)
+    """
+    try:
+        physical_disks = _wmi_service("root\\Microsoft\\Windows\\Storage").ExecQuery(
+            "SELECT DeviceId, MediaType FROM MSFT_PhysicalDisk"
+        )
+        return {
+            int(pd.DeviceId): _MEDIA_TYPES[pd.MediaType]
+            for pd in physical_disks
+            if pd.MediaType in _MEDIA_TYPES
+        }
+    except Exception as e:
+        logger.debug('MSFT_PhysicalDisk query failed: %s', e)
+        return {}
+
+
+def _list_disks_wmi() -> List[Dict[str, Any]]:
+    """
+    Helper: Query Win32_DiskDrive in-process through WMI.
+    
+    All properties come back in one query, plus one MSFT_PhysicalDisk query
+    for the media type, which WMIC and PowerShell fallbacks don't report.
+    
+    Returns:
+        List of disk information dictionaries
+        
+    Raises:
+        Exception: Any COM error raised by the query
+    """
+    drives = _wmi_service().ExecQuery(
+        "SELECT Caption, DeviceID, Model, Size, InterfaceType, Index FROM Win32_DiskDrive"
+    )
+    media_types = _physical_disk_media_types()
+    
+    disks = []
+    for drive in drives:
+        try:
+            # uint64 properties come back from COM as strings
+            size_bytes = int(drive.Size) if drive.Size else 0
+        except (TypeError, ValueError):
+            size_bytes = 0
+        size_str = _format_size(size_bytes)
+        
+        disks.append({
+            "name": drive.Caption or '',
+            "device_id": drive.DeviceID or '',
+            "model": drive.Model or '',
+            "size": size_str,
+            "size_bytes": size_bytes,
+            "interface": drive.InterfaceType or 'Unknown',
+            "media_type": media_types.get(drive.Index, 'Unknown')
+        })
+    
+    logger.debug('WMI found %d disks', len(disks))
+    return disks
+
+
+def _list_disks_wmic() -> List[Dict[str, Any]]:
     """
     Helper: Use WMIC to enumerate disks on Windows.
     
@@ -96,58 +266,39 @@ def _list_disks_wmic() -> List[Dict[str, str]]:
         if result.returncode != 0:
             raise DiskListError(f"WMIC failed with return code {result.returncode}: {result.stderr}")
         
-        logger.debug(f'WMIC stdout: {result.stdout[:500]}...')  # Truncated for logging
+        logger.debug('WMIC stdout: %.500s...', result.stdout)  # Truncated for logging
         
-        lines = result.stdout.strip().split('\n')
-        if len(lines) < 2:
+        # csv handles quoted fields, e.g. model names containing commas
+        reader = csv.DictReader(io.StringIO(result.stdout.strip()), skipinitialspace=True)
+        if reader.fieldnames is None:
             logger.warning('WMIC returned insufficient data')
             return []
+        reader.fieldnames = [h.strip() for h in reader.fieldnames]
         
-        # Parse CSV header
-        headers = [h.strip() for h in lines[0].split(',')]
         required_headers = ["Caption", "DeviceID", "Model", "Size"]
-        optional_headers = ["InterfaceType"]
-        
-        try:
-            indices = {header: headers.index(header) for header in required_headers}
-            # Add optional headers if available
-            for header in optional_headers:
-                if header in headers:
-                    indices[header] = headers.index(header)
-        except ValueError as e:
-            raise DiskListError(f"WMIC output missing required column: {e}")
+        missing = [h for h in required_headers if h not in reader.fieldnames]
+        if missing:
+            raise DiskListError(f"WMIC output missing required column: {missing[0]}")
         
         disks = []
-        for line in lines[1:]:
-            if not line.strip():
-                continue
-                
-            parts = [p.strip() for p in line.split(',')]
-            if len(parts) < len(required_headers):
-                continue
-                
+        for row in reader:
             try:
-                size_bytes = int(parts[indices["Size"]])
-                size_gb = round(size_bytes / (1024**3), 2)
-                size_str = f"{size_gb} GB"
-            except (ValueError, IndexError):
-                size_str = 'Unknown'
-            
-            # Get interface type if available
-            interface = 'Unknown'
-            if "InterfaceType" in indices and len(parts) > indices["InterfaceType"]:
-                interface = parts[indices["InterfaceType"]] or 'Unknown'
+                size_bytes = int(row["Size"])
+            except (TypeError, ValueError):
+                size_bytes = 0
+            size_str = _format_size(size_bytes)
             
             disk_info = {
-                "name": parts[indices["Caption"]],
-                "device_id": parts[indices["DeviceID"]],
-                "model": parts[indices["Model"]],
+                "name": (row["Caption"] or '').strip(),
+                "device_id": (row["DeviceID"] or '').strip(),
+                "model": (row["Model"] or '').strip(),
                 "size": size_str,
-                "interface": interface
+                "size_bytes": size_bytes,
+                "interface": (row.get("InterfaceType") or '').strip() or 'Unknown'
             }
             disks.append(disk_info)
         
-        logger.debug(f'WMIC found {len(disks)} disks')
+        logger.debug('WMIC found %d disks', len(disks))
         return disks
         
     except subprocess.TimeoutExpired:
@@ -158,7 +309,7 @@ def _list_disks_wmic() -> List[Dict[str, str]]:
         raise DiskListError(f"WMIC execution failed: {e}") from e
 
 
-def _list_disks_powershell() -> List[Dict[str, str]]:
+def _list_disks_powershell() -> List[Dict[str, Any]]:
     """
     Helper: Use PowerShell to enumerate disks on Windows.
     
@@ -169,25 +320,29 @@ def _list_disks_powershell() -> List[Dict[str, str]]:
         DiskListError: If PowerShell fails or returns invalid data
     """
     try:
+        # -NoProfile skips loading the user's profile scripts, and the
+        # Win32_DiskDrive CIM query is far cheaper than Get-PhysicalDisk
         ps_cmd = [
-            "powershell", "-Command",
-            "Get-PhysicalDisk | Select-Object FriendlyName,DeviceId,Size,MediaType,BusType | ConvertTo-Json"
+            "powershell", "-NoProfile", "-NonInteractive", "-Command",
+            "Get-CimInstance -ClassName Win32_DiskDrive | "
+            "Select-Object Caption,DeviceID,Model,Size,InterfaceType | ConvertTo-Json -Compress"
         ]
         
         result = subprocess.run(
             ps_cmd, 
             capture_output=True, 
             text=True, 
-            timeout=30
+            timeout=30,
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
         )
         
         if result.returncode != 0:
             raise DiskListError(f"PowerShell failed with return code {result.returncode}: {result.stderr}")
         
-        logger.debug(f'PowerShell stdout: {result.stdout[:500]}...')  # Truncated for logging
+        logger.debug('PowerShell stdout: %.500s...', result.stdout)  # Truncated for logging
         
         try:
-            disks_info = json.loads(result.stdout)
+            disks_info = jsonio.loads(result.stdout)
         except json.JSONDecodeError as e:
             raise DiskListError(f"PowerShell returned invalid JSON: {e}")
         
@@ -198,50 +353,23 @@ def _list_disks_powershell() -> List[Dict[str, str]]:
         disks = []
         for d in disks_info:
             try:
-                device_id = d.get('DeviceId')
-                if device_id is None:
+                device_id = d.get('DeviceID')
+                if not device_id:
                     continue
                     
                 size_bytes = d.get('Size', 0)
-                if size_bytes and isinstance(size_bytes, (int, float)):
-                    size_gb = round(size_bytes / (1024**3), 2)
-                    size_str = f"{size_gb} GB"
-                else:
-                    size_str = 'Unknown'
-                
-                friendly_name = d.get('FriendlyName', f"PhysicalDrive{device_id}")
-                name = friendly_name if friendly_name else f"PhysicalDrive{device_id}"
-                
-                # Get interface type
-                bus_type = d.get('BusType', 'Unknown')
-                interface_map = {
-                    '0': 'Unknown',
-                    '1': 'SCSI',
-                    '2': 'ATAPI',
-                    '3': 'ATA',
-                    '4': 'IEEE 1394',
-                    '5': 'SSA',
-                    '6': 'FC',
-                    '7': 'USB',
-                    '8': 'RAID',
-                    '9': 'iSCSI',
-                    '10': 'SAS',
-                    '11': 'SATA',
-                    '12': 'SD',
-                    '13': 'MMC',
-                    '14': 'Virtual',
-                    '15': 'File Backed Virtual',
-                    '16': 'Storage Spaces',
-                    '17': 'NVMe'
-                }
-                interface = interface_map.get(str(bus_type), f"{bus_type}")
+                if not isinstance(size_bytes, (int, float)):
+                    size_bytes = 0
+                size_bytes = int(size_bytes)
+                size_str = _format_size(size_bytes)
                 
                 disk_info = {
-                    "name": name,
-                    "device_id": f"\\\\.\\PhysicalDrive{device_id}",
-                    "model": d.get('MediaType', 'Unknown'),
+                    "name": d.get('Caption') or device_id,
+                    "device_id": device_id,
+                    "model": d.get('Model') or 'Unknown',
                     "size": size_str,
-                    "interface": interface
+                    "size_bytes": size_bytes,
+                    "interface": d.get('InterfaceType') or 'Unknown'
                 }
                 disks.append(disk_info)
                 
@@ -249,7 +377,7 @@ def _list_disks_powershell() -> List[Dict[str, str]]:
                 logger.warning(f"Failed to parse disk info: {d}, error: {e}")
                 continue
         
-        logger.debug(f'PowerShell found {len(disks)} disks')
+        logger.debug('PowerShell found %d disks', len(disks))
         return disks
         
     except subprocess.TimeoutExpired:
@@ -4,24 +4,237 @@ disk_ops.py - Disk imaging and cloning operations for the portable disk imaging
 Contains functions for creating disk images, cloning disks, and buffer size logic.
 LLM prompt: This module provides robust, low-level disk operations for physical and image disks.
 """
-import shutil
+import errno
 import logging
-import platform
 import os
+import queue
 import subprocess
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from .constants import PLATFORM_SYSTEM
 from .qemu import QemuManager
+from . import bufpool
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 BUFFER_SIZE = 64 * 1024 * 1024  # 64MB for default buffer size
-is_windows = platform.system() == "Windows"
+PIPELINE_DEPTH = 4  # Extra frames queued ahead of the compression workers
+COMPRESS_WORKERS = min(os.cpu_count() or 1, 8)
+MAX_INFLIGHT_BYTES = 256 * 1024 * 1024  # Cap on buffered data held by the copy and compression pipelines
+GZIP_LEVEL = 6
+GZIP_WBITS = 31  # zlib window bits that select the gzip container
+DIRECT_IO_ALIGNMENT = 4096  # O_DIRECT buffer and transfer size alignment
+is_windows = PLATFORM_SYSTEM == "Windows"
+# errno values meaning a kernel copy primitive cannot handle this pair of files
+_KERNEL_COPY_UNSUPPORTED = frozenset(
+    code for code in (errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP,
+                      getattr(errno, 'ENOTSUP', None), errno.EBADF)
+    if code is not None
+)
 
 def get_buffer_size():
     """Return the fixed buffer size for disk operations (64MB)."""
     return BUFFER_SIZE
 
-def create_disk_image(disk_info, output_path, progress_callback=None, image_format='img', compress=False, buffer_size=None, cleanup_tools=False):
+def _compress_frame(data):
+    """Compress one frame into a self-contained gzip member."""
+    compressobj = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, GZIP_WBITS)
+    return compressobj.compress(data) + compressobj.flush()
+
+def _compress_stream(disk_file, output_path, bs, progress_callback=None):
+    """
+    Read disk_file in frames of at most bs bytes and write it gzip-compressed to output_path.
+    With several cores each frame is compressed independently on a thread pool (zlib
+    releases the GIL, so frames compress in parallel) and the concatenated gzip members
+    form a valid gzip file. With a single core one long-lived compressor streams every
+    frame on the writer thread instead, keeping the dictionary across frames.
+    At most MAX_INFLIGHT_BYTES of frames are held at once: when bs is too large for the
+    pipeline depth the frames are made smaller rather than fewer.
+    Returns the number of bytes read.
+    """
+    workers = COMPRESS_WORKERS
+    parallel = workers > 1
+    depth = workers + PIPELINE_DEPTH
+    # Queued frames plus the one being written and the one being read
+    frame_size = min(bs, MAX_INFLIGHT_BYTES // (depth + 2))
+    frame_size = max(DIRECT_IO_ALIGNMENT, frame_size - frame_size % DIRECT_IO_ALIGNMENT)
+    write_q = queue.Queue(maxsize=depth)
+    errors = []
+
+    def writer(image_file):
+        # Queue items are futures of compressed frames, or raw frames when serial
+        compressobj = None if parallel else zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, GZIP_WBITS)
+        # After an error keep draining so the reader never blocks on a full queue
+        item = write_q.get()
+        while item is not None:
+            if not errors:
+                try:
+                    image_file.write(item.result() if parallel else compressobj.compress(item))
+                except Exception as e:
+                    errors.append(e)
+            elif parallel:
+                item.cancel()
+            item = write_q.get()
+        if compressobj is not None and not errors:
+            try:
+                image_file.write(compressobj.flush())
+            except Exception as e:
+                errors.append(e)
+
+    bytes_read = 0
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='disk-compress') if parallel else None
+    try:
+        with open(output_path, 'wb') as image_file:
+            write_thread = threading.Thread(target=writer, args=(image_file,), name='disk-write', daemon=True)
+            write_thread.start()
+            try:
+                while not errors:
+                    chunk = disk_file.read(frame_size)
+                    if not chunk:
+                        break
+                    write_q.put(pool.submit(_compress_frame, chunk) if parallel else chunk)
+                    bytes_read += len(chunk)
+                    if progress_callback:
+                        progress_callback(bytes_read)
+            finally:
+                write_q.put(None)
+                write_thread.join()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    if errors:
+        raise errors[0]
+    return bytes_read
+
+def _kernel_copy(src_fd, dst_fd, bs, progress_callback=None):
+    """
+    Copy src_fd to dst_fd without passing the data through userspace, using
+    copy_file_range() and falling back to sendfile() (which accepts block device
+    sources). Returns the number of bytes copied, or None if neither call
+    supports this pair of files so the caller can fall back to a read loop.
+    """
+    copiers = []
+    if hasattr(os, 'copy_file_range'):
+        copiers.append(lambda: os.copy_file_range(src_fd, dst_fd, bs))
+    if hasattr(os, 'sendfile'):
+        copiers.append(lambda: os.sendfile(dst_fd, src_fd, None, bs))
+    for copy in copiers:
+        copied = 0
+        try:
+            while True:
+                n = copy()
+                if not n:
+                    break
+                copied += n
+                if progress_callback:
+                    progress_callback(copied)
+        except OSError as e:
+            # Only fall back if nothing was copied yet, otherwise the offsets have moved
+            if copied or e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+            continue
+        return copied
+    return None
+
+def _enable_direct_io(fd, probe_buf):
+    """
+    Switch fd to O_DIRECT so reads bypass the page cache. probe_buf must be an
+    aligned buffer whose size is a multiple of DIRECT_IO_ALIGNMENT. Returns False,
+    leaving fd unchanged, if the platform or the underlying file does not support it.
+    """
+    if fcntl is None or not hasattr(os, 'O_DIRECT') or not hasattr(os, 'preadv'):
+        return False
+    try:
+        flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+        fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_DIRECT)
+    except OSError:
+        return False
+    try:
+        # Probe without moving the file position; filesystems without O_DIRECT fail here
+        os.preadv(fd, [probe_buf], 0)
+    except OSError:
+        fcntl.fcntl(fd, fcntl.F_SETFL, flags)
+        return False
+    return True
+
+def _copy_raw(fd, image_file, bs, sparse, progress_callback=None):
+    """
+    Copy fd to image_file through a small ring of buffers carved from one aligned
+    slab taken from the shared buffer pool, so repeated jobs reuse the same pages.
+    The calling thread keeps reads queued ahead while a writer thread drains filled
+    buffers, so device reads overlap output writes. With sparse=True all-zero buffers are skipped with a
+    seek, leaving a hole. The slab never exceeds MAX_INFLIGHT_BYTES: when bs is too large
+    the slots are made smaller rather than fewer. Returns the number of bytes copied.
+    """
+    depth = PIPELINE_DEPTH
+    # Slots are multiples of the O_DIRECT alignment; the pooled slab is page-aligned
+    size = min(-(-bs // DIRECT_IO_ALIGNMENT) * DIRECT_IO_ALIGNMENT, MAX_INFLIGHT_BYTES // depth)
+    size = max(DIRECT_IO_ALIGNMENT, size - size % DIRECT_IO_ALIGNMENT)
+    slab = bufpool.acquire(size * depth)
+    slab_view = memoryview(slab)
+    bufs = [slab_view[i * size:(i + 1) * size] for i in range(depth)]
+    _enable_direct_io(fd, bufs[0])
+    # startswith() on a zero buffer is a memcmp that stops at the
+    # first non-zero byte and accepts any buffer, including views
+    zero_chunk = bytes(len(bufs[0])) if sparse else None
+    free_q = queue.Queue()
+    for buf in bufs:
+        free_q.put(buf)
+    full_q = queue.Queue()
+    errors = []
+
+    def writer():
+        # After an error keep returning buffers so the reader never blocks
+        item = full_q.get()
+        while item is not None:
+            buf, n = item
+            if not errors:
+                try:
+                    with buf[:n] as chunk:
+                        if sparse and zero_chunk.startswith(chunk):
+                            # Leave a hole instead of writing zeros
+                            image_file.seek(n, 1)
+                        else:
+                            image_file.write(chunk)
+                except Exception as e:
+                    errors.append(e)
+            free_q.put(buf)
+            item = full_q.get()
+
+    bytes_read = 0
+    write_thread = threading.Thread(target=writer, name='disk-write', daemon=True)
+    write_thread.start()
+    try:
+        while not errors:
+            buf = free_q.get()
+            n = os.readv(fd, [buf])
+            if not n:
+                break
+            full_q.put((buf, n))
+            bytes_read += n
+            if progress_callback:
+                progress_callback(bytes_read)
+    finally:
+        full_q.put(None)
+        write_thread.join()
+        for buf in bufs:
+            buf.release()
+        slab_view.release()
+        bufpool.release(slab)
+    if errors:
+        raise errors[0]
+    return bytes_read
+
+def create_disk_image(disk_info, output_path, progress_callback=None, image_format='img', compress=False, buffer_size=None, cleanup_tools=False, sparse=True):
     """
     Create a disk image in the specified format, with optional compression.
     On Windows, always use QEMU for physical disk imaging, not Python file I/O.
+    With sparse=True all-zero chunks are skipped in the output; with sparse=False
+    uncompressed images are copied in the kernel where the platform allows it.
     Returns (True, None) on success, (False, error) on failure.
     """
     device_path = disk_info['device_id']
@@ -42,19 +255,30 @@ def create_disk_image(disk_info, output_path, progress_callback=None, image_form
     if image_format not in ('img', 'iso'):
         raw_path = output_path + '.tmp.raw'
     try:
-        with open(device_path, 'rb') as disk_file, open(raw_path, 'wb') as image_file:
+        with open(device_path, 'rb') as disk_file:
             logging.debug('Disk image creation started')
-            while True:
-                chunk = disk_file.read(bs)
-                if not chunk:
-                    break
-                if chunk.count(b'\0') == len(chunk):
-                    image_file.seek(len(chunk), 1)
-                else:
-                    image_file.write(chunk)
-                bytes_read += len(chunk)
-                if progress_callback:
-                    progress_callback(bytes_read)
+            # The device is read once front to back: ask the kernel for
+            # aggressive readahead so reads stay queued ahead of the loop
+            if hasattr(os, 'posix_fadvise'):
+                try:
+                    os.posix_fadvise(disk_file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
+            if compress and image_format in ('img', 'iso'):
+                # Compress while reading instead of in a second pass over the image
+                bytes_read = _compress_stream(disk_file, raw_path, bs, progress_callback)
+            else:
+                with open(raw_path, 'wb') as image_file:
+                    copied = None
+                    if not sparse:
+                        copied = _kernel_copy(disk_file.fileno(), image_file.fileno(), bs, progress_callback)
+                    if copied is not None:
+                        bytes_read = copied
+                    else:
+                        bytes_read = _copy_raw(disk_file.fileno(), image_file, bs, sparse, progress_callback)
+                        if sparse:
+                            # A trailing hole is only a seek; extend the file to full size
+                            image_file.truncate(bytes_read)
         if image_format not in ('img', 'iso'):
             qemu_manager = QemuManager()
             qemu_manager.initialize()
@@ -65,16 +289,6 @@ def create_disk_image(disk_info, output_path, progress_callback=None, image_form
             os.remove(raw_path)
             if not success:
                 return False, error
-        elif compress:
-            try:
-                import gzip
-                gz_path = output_path + '.gz'
-                with open(raw_path, 'rb') as f_in, gzip.open(gz_path, 'wb') as f_out:
-                    shutil.copyfileobj(f_in, f_out)
-                os.remove(raw_path)
-                os.rename(gz_path, output_path)
-            except Exception as e:
-                return False, f"Compression failed: {e}"
         logging.info('Disk image creation finished successfully')
         return True, None
     except Exception as e:
@@ -13,7 +13,8 @@ from .validation import (
     validate_archive_format, validate_buffer_size
 )
 from .exceptions import DiskImageError, ValidationError
-from .constants import SPARSE_FORMATS
+from .constants import SPARSE_FORMATS, RAW_FORMATS, PLATFORM_SYSTEM
+from .disk_ops import create_disk_image
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,7 @@ class ImagingWorker:
     def __init__(self):
         self.qemu_manager = QemuManager()
         self.archive_manager = ArchiveManager()
+        self.is_windows = PLATFORM_SYSTEM == "Windows"
     
     def run_imaging_job(
         self,
@@ -36,7 +38,8 @@ class ImagingWorker:
         archive_type: Optional[str] = None,
         buffer_size: Optional[int] = None,
         cleanup_tools: bool = True,
-        progress_callback: Optional[Callable[[int], None]] = None
+        progress_callback: Optional[Callable[[int], None]] = None,
+        log_callback: Optional[Callable[[str], None]] = None
     ) -> Tuple[bool, str, str]:
         """
         Run the complete imaging and optional archiving job.
@@ -52,6 +55,7 @@ class ImagingWorker:
             buffer_size: Buffer size in bytes for raw operations
             cleanup_tools: Clean up extracted tools after operation
             progress_callback: Function to call with progress updates
+            log_callback: Function called with each job log line as it is logged
             
         Returns:
             Tuple of (success, message, log_output)
@@ -59,9 +63,12 @@ class ImagingWorker:
         log_messages = []
         
         def log_and_capture(level: int, message: str) -> None:
-            """Log message and capture it for return."""
+            """Log message, capture it for return and pass it to log_callback."""
             logger.log(level, message)
-            log_messages.append(f"{logging.getLevelName(level)}: {message}")
+            line = f"{logging.getLevelName(level)}: {message}"
+            log_messages.append(line)
+            if log_callback:
+                log_callback(line)
         
         try:
             # Validate all inputs
@@ -81,7 +88,7 @@ class ImagingWorker:
                 log_and_capture(logging.INFO, "Using QEMU sparse imaging")
                 success, error = self._run_qemu_imaging(
                     validated_disk,
-                    str(validated_output),
+                    validated_output,
                     validated_format,
                     use_compress,
                     progress_callback
@@ -90,16 +97,17 @@ class ImagingWorker:
                 log_and_capture(logging.INFO, "Using direct disk imaging")
                 success, error = self._run_direct_imaging(
                     validated_disk,
-                    str(validated_output),
+                    validated_output,
                     validated_format,
                     use_compress,
                     validated_buffer,
-                    progress_callback
+                    progress_callback,
+                    sparse=use_sparse
                 )
             
             if not success:
                 log_and_capture(logging.ERROR, f"Imaging failed: {error}")
-                return False, f"Imaging failed: {error}", "\\n".join(log_messages)
+                return False, f"Imaging failed: {error}", "\n".join(log_messages)
             
             log_and_capture(logging.INFO, "Imaging completed successfully")
             
@@ -115,30 +123,30 @@ class ImagingWorker:
                 
                 if archive_success:
                     log_and_capture(logging.INFO, f"Archive created: {archive_result}")
-                    return True, f"Imaging and archiving completed: {archive_result}", "\\n".join(log_messages)
+                    return True, f"Imaging and archiving completed: {archive_result}", "\n".join(log_messages)
                 else:
                     log_and_capture(logging.WARNING, f"Archive creation failed: {archive_result}")
-                    return False, f"Imaging completed, but archiving failed: {archive_result}", "\\n".join(log_messages)
+                    return False, f"Imaging completed, but archiving failed: {archive_result}", "\n".join(log_messages)
             
-            return True, "Imaging completed successfully", "\\n".join(log_messages)
+            return True, "Imaging completed successfully", "\n".join(log_messages)
             
         except ValidationError as e:
             log_and_capture(logging.ERROR, f"Validation error: {e}")
-            return False, f"Invalid input: {e}", "\\n".join(log_messages)
+            return False, f"Invalid input: {e}", "\n".join(log_messages)
             
         except DiskImageError as e:
             log_and_capture(logging.ERROR, f"Disk imaging error: {e}")
-            return False, str(e), "\\n".join(log_messages)
+            return False, str(e), "\n".join(log_messages)
             
         except Exception as e:
             log_and_capture(logging.CRITICAL, f"Unexpected error: {e}")
             logger.exception("Unexpected error in imaging job")
-            return False, f"Unexpected error: {e}", "\\n".join(log_messages)
+            return False, f"Unexpected error: {e}", "\n".join(log_messages)
     
     def _run_qemu_imaging(
         self,
         disk_info: Dict[str, str],
-        output_path: str,
+        output_path: Path,
         image_format: str,
         compress: bool,
         progress_callback: Optional[Callable[[int], None]]
@@ -174,11 +182,12 @@ class ImagingWorker:
     def _run_direct_imaging(
         self,
         disk_info: Dict[str, str],
-        output_path: str,
+        output_path: Path,
         image_format: str,
         compress: bool,
         buffer_size: int,
-        progress_callback: Optional[Callable[[int], None]]
+        progress_callback: Optional[Callable[[int], None]],
+        sparse: bool = True
     ) -> Tuple[bool, Optional[str]]:
         """
         Run direct file-based imaging for raw formats.
@@ -190,12 +199,28 @@ class ImagingWorker:
             compress: Enable compression
             buffer_size: Buffer size in bytes
             progress_callback: Progress callback function
+            sparse: Skip all-zero chunks instead of writing them
             
         Returns:
             Tuple of (success, error_message)
-        """        # For now, delegate to QEMU as it's more reliable for physical disks
-        # TODO: Implement direct imaging for special cases
-        return self._run_qemu_imaging(disk_info, output_path, image_format, compress, progress_callback)
+        """
+        # On Windows, QEMU is more reliable for physical disks; elsewhere raw
+        # formats are copied directly with a streaming read loop
+        if self.is_windows or image_format not in RAW_FORMATS:
+            return self._run_qemu_imaging(disk_info, output_path, image_format, compress, progress_callback)
+        
+        try:
+            return create_disk_image(
+                disk_info,
+                str(output_path),
+                progress_callback=progress_callback,
+                image_format=image_format,
+                compress=compress,
+                buffer_size=buffer_size,
+                sparse=sparse
+            )
+        except Exception as e:
+            return False, str(e)
 
 
 # Legacy function for backward compatibility
@@ -209,7 +234,8 @@ def run_imaging_job(
     archive_type: Optional[str],
     buffer_size: Optional[int],
     cleanup_tools: bool,
-    progress_callback: Optional[Callable[[int], None]] = None
+    progress_callback: Optional[Callable[[int], None]] = None,
+    log_callback: Optional[Callable[[str], None]] = None
 ) -> Tuple[bool, str, str]:
     """
     Legacy function for backward compatibility.
@@ -228,5 +254,6 @@ def run_imaging_job(
         archive_type=archive_type,
         buffer_size=buffer_size,
         cleanup_tools=cleanup_tools,
-        progress_callback=progress_callback
+        progress_callback=progress_callback,
+        log_callback=log_callback
     )
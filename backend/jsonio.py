@@ -0,0 +1,48 @@
+"""
+JSON parsing and serialization for the disk imaging app.
+
+Uses orjson when it is installed and falls back to the standard json module.
+orjson's errors subclass json.JSONDecodeError, so callers catch that either way.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: JSON text, as str or UTF-8 bytes
+        
+    Returns:
+        The decoded object
+        
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if HAS_ORJSON:
+        result: Any = orjson.loads(data)
+        return result
+    return json.loads(data)
+
+
+def dumps_indented(data: Any) -> bytes:
+    """
+    Serialize data as UTF-8 JSON indented by two spaces.
+    
+    Args:
+        data: Object to serialize
+        
+    Returns:
+        Encoded JSON document
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
@@ -3,12 +3,28 @@ Logging setup and utilities for the disk imaging app.
 
 Provides robust error/debug logging configuration for all modules.
 """
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
-from .constants import LOG_FILE
+from .constants import LOG_FILE, LOG_MAX_BYTES, LOG_BACKUP_COUNT
+
+# Background thread that writes queued records to the real handlers
+_queue_listener: Optional[QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records, stop the listener thread and close its handlers."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
 
 
 def setup_logging(
@@ -19,6 +35,11 @@ def setup_logging(
     """
     Set up logging to file and optionally console for the app.
     
+    Records are handed to the file and console handlers on a listener thread
+    through a queue, so threads that log never block on log file writes.
+    Calling it again replaces the previous handlers rather than adding more.
+    The log file rotates at LOG_MAX_BYTES so debug output can't grow unbounded.
+    
     Args:
         logfile: Path to log file, defaults to LOG_FILE
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -41,14 +62,18 @@ def setup_logging(
     root_logger.setLevel(level)
     
     # Clear any existing handlers
+    _stop_queue_listener()
     root_logger.handlers.clear()
+    handlers: List[logging.Handler] = []
     
     # File handler
     try:
-        file_handler = logging.FileHandler(logfile, encoding='utf-8')
+        file_handler = RotatingFileHandler(
+            logfile, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+        )
         file_handler.setFormatter(formatter)
         file_handler.setLevel(level)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
     except Exception as e:
         print(f"Warning: Could not setup file logging: {e}", file=sys.stderr)
     
@@ -57,13 +82,23 @@ def setup_logging(
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
         console_handler.setLevel(level)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # Loggers only enqueue records; the listener thread does the actual I/O
+    global _queue_listener
+    log_queue: queue.Queue = queue.Queue(-1)
+    root_logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
     
     # Log the setup
     logger = logging.getLogger(__name__)
     logger.info(f"Logging initialized - Level: {logging.getLevelName(level)}, File: {logfile}")
 
 
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for the given name.
@@ -1,24 +1,27 @@
 """
 QEMU management and operations for disk imaging.
 """
-import platform
+import io
+import re
 import subprocess
 import logging
 import threading
-import time
 import os
 from pathlib import Path
-from typing import Tuple, Optional, List, Callable
+from typing import Tuple, Optional, List, Callable, Union, cast
 
 from .constants import (
     REQUIRED_QEMU_FILES, QEMU_DIR, TOOLS_DIR, WINDOWS_DLL_NOT_FOUND,
-    ARCHIVE_PRIORITY
+    ARCHIVE_PRIORITY, PLATFORM_SYSTEM
 )
 from .exceptions import QemuError, QemuNotFoundError, QemuExtractionError
 from .validation import validate_output_path, sanitize_path_for_subprocess
 
 logger = logging.getLogger(__name__)
 
+# Progress lines printed by `qemu-img convert -p`, e.g. "    (12.34/100%)"
+_PROGRESS_RE = re.compile(rb'\(\s*([\d.]+)/100%\)')
+
 
 class QemuManager:
     """Manages QEMU installation, extraction, and execution."""
@@ -26,7 +29,7 @@ class QemuManager:
     def __init__(self):
         self.qemu_dir = QEMU_DIR
         self.qemu_executable = self.qemu_dir / "qemu-img.exe"
-        self.is_windows = platform.system() == "Windows"
+        self.is_windows = PLATFORM_SYSTEM == "Windows"
     
     def initialize(self) -> None:
         """
@@ -133,7 +136,7 @@ class QemuManager:
     def create_image(
         self,
         source_path: str,
-        output_path: str,
+        output_path: Union[str, Path],
         image_format: str = "raw",
         compress: bool = False,
         sparse: bool = True,
@@ -144,7 +147,8 @@ class QemuManager:
         
         Args:
             source_path: Source device or file path
-            output_path: Output image path
+            output_path: Output image path; a Path already returned by
+                validate_output_path() is not resolved again
             image_format: Output format (raw, qcow2, vhd, vmdk)
             compress: Enable compression if supported
             sparse: Use sparse allocation
@@ -356,9 +360,9 @@ class QemuManager:
         
         try:
             # List current files for debugging
-            if self.qemu_dir.exists():
+            if logger.isEnabledFor(logging.DEBUG) and self.qemu_dir.exists():
                 current_files = [f.name for f in self.qemu_dir.iterdir() if f.is_file()]
-                logger.debug(f"Current QEMU files: {current_files}")
+                logger.debug("Current QEMU files: %s", current_files)
             
             # Re-extract
             self._extract_qemu()
@@ -377,7 +381,11 @@ class QemuManager:
         progress_callback: Callable[[int], None]
     ) -> Tuple[bool, Optional[str]]:
         """
-        Run QEMU command with progress monitoring by tracking output file size.
+        Run QEMU command with progress monitoring.
+        
+        Progress is parsed from the percentages qemu-img prints with -p and
+        scaled by the source size. If the source size is unknown, the size of
+        the output file is reported instead.
         
         Args:
             command: QEMU command arguments
@@ -395,7 +403,6 @@ class QemuManager:
             try:
                 if source_path.startswith('\\\\.\\PhysicalDrive'):
                     # For Windows physical drives, try to get size via WMI
-                    import re
                     drive_match = re.search(r'PhysicalDrive(\d+)', source_path)
                     if drive_match:
                         drive_num = drive_match.group(1)
@@ -408,8 +415,10 @@ class QemuManager:
                         if result.returncode == 0 and result.stdout.strip():
                             source_size = int(result.stdout.strip())
                 else:
-                    # Regular file
-                    source_size = os.path.getsize(source_path)
+                    # Seeking to the end also works for block devices, whose
+                    # stat size is 0
+                    with open(source_path, 'rb') as source:
+                        source_size = source.seek(0, os.SEEK_END)
             except Exception as e:
                 logger.warning(f"Could not determine source size: {e}")
                 source_size = 0
@@ -418,20 +427,38 @@ class QemuManager:
             qemu_path = self.get_executable_path()
             full_command = [str(qemu_path)] + command
             
-            # Start the QEMU process
+            # Start the QEMU process; stderr is merged so a single reader drains both
             process = subprocess.Popen(
                 full_command,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stderr=subprocess.STDOUT
             )
+            assert process.stdout is not None
+            # With the default bufsize the pipe is a BufferedReader, which provides read1()
+            stdout = cast(io.BufferedReader, process.stdout)
             
-            # Monitor progress in a separate thread
+            output_lines: List[bytes] = []
             progress_stop = threading.Event()
             
-            def monitor_progress():
+            def read_output() -> None:
+                # qemu-img redraws its progress line with '\r', so split on both
+                pending = b''
+                for data in iter(lambda: stdout.read1(4096), b''):
+                    pending += data
+                    *lines, pending = re.split(rb'[\r\n]', pending)
+                    for line in lines:
+                        match = _PROGRESS_RE.search(line)
+                        if match:
+                            if source_size:
+                                progress_callback(int(float(match.group(1)) * source_size / 100))
+                        elif line.strip():
+                            output_lines.append(line)
+                if pending.strip() and not _PROGRESS_RE.search(pending):
+                    output_lines.append(pending)
+            
+            def monitor_output_size() -> None:
                 last_size = 0
-                while not progress_stop.is_set() and process.poll() is None:
+                while not progress_stop.wait(0.5):
                     try:
                         if output_path.exists():
                             current_size = output_path.stat().st_size
@@ -440,42 +467,48 @@ class QemuManager:
                                 last_size = current_size
                     except Exception:
                         pass
-                    time.sleep(0.5)  # Check every 500ms
             
-            progress_thread = threading.Thread(target=monitor_progress)
-            progress_thread.start()
+            threads = [threading.Thread(target=read_output, daemon=True)]
+            if not source_size:
+                threads.append(threading.Thread(target=monitor_output_size, daemon=True))
+            for thread in threads:
+                thread.start()
+            
+            def stop_threads() -> None:
+                progress_stop.set()
+                for thread in threads:
+                    thread.join(timeout=1)
+                stdout.close()
             
             try:
                 # Wait for process completion
-                stdout, stderr = process.communicate(timeout=3600)  # 1 hour timeout
-                
-                # Stop progress monitoring
-                progress_stop.set()
-                progress_thread.join(timeout=1)
-                
-                if process.returncode == 0:
-                    # Send final progress update
-                    if output_path.exists():
-                        final_size = output_path.stat().st_size
-                        progress_callback(final_size)
-                    
-                    logger.info("QEMU image creation completed successfully")
-                    return True, None
-                else:
-                    error_msg = f"qemu-img failed (code {process.returncode}):\\n"
-                    if stdout:
-                        error_msg += f"STDOUT:\\n{stdout}\\n"
-                    if stderr:
-                        error_msg += f"STDERR:\\n{stderr}"
-                    
-                    logger.error(error_msg)
-                    return False, error_msg
-                    
+                process.wait(timeout=3600)  # 1 hour timeout
             except subprocess.TimeoutExpired:
                 process.kill()
-                progress_stop.set()
-                progress_thread.join(timeout=1)
+                # Reap the child so its end of the pipe closes and the reader sees EOF
+                process.wait()
+                stop_threads()
                 return False, "QEMU imaging process timed out"
+            
+            stop_threads()
+            output = b'\n'.join(output_lines).decode(errors='replace')
+            
+            if process.returncode == 0:
+                # Send final progress update
+                if source_size:
+                    progress_callback(source_size)
+                elif output_path.exists():
+                    progress_callback(output_path.stat().st_size)
+                
+                logger.info("QEMU image creation completed successfully")
+                return True, None
+            
+            error_msg = f"qemu-img failed (code {process.returncode}):\n"
+            if output:
+                error_msg += f"OUTPUT:\n{output}"
+            
+            logger.error(error_msg)
+            return False, error_msg
                 
         except Exception as e:
             logger.exception("Exception in QEMU image creation with progress")
@@ -186,6 +186,8 @@ class SevenZipManager:
             elif archive_type == "zip":
                 command.extend(['-tzip'])
             
+            # Compress with all cores (LZMA2 splits a single file across threads)
+            command.append('-mmt=on')
             command.extend(source_files)
             
             result = subprocess.run(
@@ -13,6 +13,7 @@ import urllib.request
 import subprocess
 import tempfile
 import shutil
+import secrets
 import os
 from pathlib import Path
 import logging
@@ -35,7 +36,9 @@ from .constants import (
     SEVENZIP_WINDOWS_URL, 
     TOOLS_DIR, 
     QEMU_DIR, 
-    SEVENZIP_DIR
+    SEVENZIP_DIR,
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_LOG_INTERVAL
 )
 
 logger = logging.getLogger(__name__)
@@ -66,9 +69,7 @@ class ThirdPartyDownloader:
         
         try:
             # Download QEMU installer/archive
-            with tempfile.NamedTemporaryFile(suffix='.exe', delete=False) as temp_file:
-                temp_path = Path(temp_file.name)
-                
+            temp_path = ThirdPartyDownloader._temp_installer_path()
             ThirdPartyDownloader._download_with_progress(QEMU_WINDOWS_URL, temp_path)
             
             # Extract QEMU files from the installer using 7-Zip (if available)
@@ -79,6 +80,7 @@ class ThirdPartyDownloader:
             
             if not success:
                 logger.error("Failed to extract QEMU files")
+                temp_path.unlink(missing_ok=True)
                 return False
                 
             # Clean up installer
@@ -118,9 +120,7 @@ class ThirdPartyDownloader:
         
         try:
             # Download 7-Zip installer
-            with tempfile.NamedTemporaryFile(suffix='.exe', delete=False) as temp_file:
-                temp_path = Path(temp_file.name)
-                
+            temp_path = ThirdPartyDownloader._temp_installer_path()
             ThirdPartyDownloader._download_with_progress(SEVENZIP_WINDOWS_URL, temp_path)
             
             # Extract 7-Zip files from installer
@@ -129,6 +129,7 @@ class ThirdPartyDownloader:
             
             if not success:
                 logger.error("Failed to extract 7-Zip files")
+                temp_path.unlink(missing_ok=True)
                 return False
                 
             # Clean up installer
@@ -146,6 +147,16 @@ class ThirdPartyDownloader:
             logger.error(f"Failed to download/extract 7-Zip: {e}")
             return False
 
+    @staticmethod
+    def _temp_installer_path() -> Path:
+        """
+        Build a unique path in the temp directory for a downloaded installer.
+        
+        Returns:
+            Path: Path that does not exist yet; the download creates it
+        """
+        return Path(tempfile.gettempdir()) / f"diskimage_{secrets.token_hex(8)}.exe"
+
     @staticmethod
     def _verify_qemu() -> bool:
         """
@@ -188,21 +199,38 @@ class ThirdPartyDownloader:
                 total_size = int(response.headers.get('Content-Length', 0))
                 
                 with open(dest, 'wb') as out_file:
+                    # Reserve the full extent up front so the filesystem can
+                    # allocate it contiguously instead of growing per write
+                    if total_size > 0 and hasattr(os, 'posix_fallocate'):
+                        try:
+                            os.posix_fallocate(out_file.fileno(), 0, total_size)
+                        except OSError as e:
+                            logger.debug(f"Could not preallocate download file: {e}")
+                    
                     downloaded = 0
-                    chunk_size = 8192
+                    last_logged = 0
+                    # Reuse one buffer for every read instead of allocating per chunk
+                    buffer = bytearray(DOWNLOAD_CHUNK_SIZE)
+                    view = memoryview(buffer)
                     
                     while True:
-                        chunk = response.read(chunk_size)
-                        if not chunk:
+                        bytes_read = response.readinto(buffer)
+                        if not bytes_read:
                             break
                             
-                        out_file.write(chunk)
-                        downloaded += len(chunk)
+                        out_file.write(view[:bytes_read])
+                        downloaded += bytes_read
                         
-                        if total_size > 0:
+                        if (total_size > 0
+                                and downloaded - last_logged >= DOWNLOAD_LOG_INTERVAL
+                                and logger.isEnabledFor(logging.INFO)):
                             percent = (downloaded / total_size) * 100
-                            if downloaded % (chunk_size * 100) == 0:  # Log every ~800KB
-                                logger.info(f"Download progress: {percent:.1f}%")
+                            logger.info("Download progress: %.1f%%", percent)
+                            last_logged = downloaded
+                    
+                    # Drop any preallocated tail if the server sent less than promised
+                    if downloaded != total_size:
+                        out_file.truncate(downloaded)
                                 
             logger.info(f"Download completed: {dest.name}")
             
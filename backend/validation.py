@@ -2,11 +2,23 @@
 Input validation utilities for DiskImage application.
 """
 from pathlib import Path
-from typing import Dict, Any, Optional, Mapping
-import re
+from typing import Dict, Any, Optional, Mapping, Union
 
 from .exceptions import ValidationError
-from .constants import SUPPORTED_IMAGE_FORMATS, SUPPORTED_ARCHIVE_FORMATS
+from .constants import (
+    SUPPORTED_IMAGE_FORMATS, SUPPORTED_ARCHIVE_FORMATS, DEFAULT_BUFFER_SIZE,
+    MIN_BUFFER_SIZE, BUFFER_ALIGNMENT, BYTES_PER_GB
+)
+
+# Translation table that strips characters not allowed in filenames
+_INVALID_CHARS_TABLE = str.maketrans('', '', '<>:"|?*')
+
+# Characters that could be abused for shell injection in subprocess calls
+_DANGEROUS_CHARS = frozenset('&|;$`(){}')
+
+# Hashable lookups for format validation, built once at import
+_IMAGE_FORMAT_CODES = frozenset(SUPPORTED_IMAGE_FORMATS.values())
+_ARCHIVE_FORMATS = frozenset(SUPPORTED_ARCHIVE_FORMATS)
 
 
 def validate_disk_info(disk_info: Mapping[str, str]) -> Dict[str, str]:
@@ -38,12 +50,13 @@ def validate_disk_info(disk_info: Mapping[str, str]) -> Dict[str, str]:
     return dict(disk_info)
 
 
-def validate_output_path(output_path: str) -> Path:
+def validate_output_path(output_path: Union[str, Path]) -> Path:
     """
     Validate and normalize output file path.
     
     Args:
-        output_path: Output file path string
+        output_path: Output file path string, or an absolute Path returned by
+            an earlier call, which is used as is instead of being resolved again
         
     Returns:
         Validated Path object
@@ -54,21 +67,24 @@ def validate_output_path(output_path: str) -> Path:
     if not output_path:
         raise ValidationError("Output path must be a non-empty string")
     
-    path = Path(output_path).resolve()
+    if isinstance(output_path, Path) and output_path.is_absolute():
+        path = output_path
+    else:
+        path = Path(output_path).resolve()
     
     # Check if parent directory exists or can be created
-    try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-    except Exception as e:
-        raise ValidationError(f"Cannot create output directory: {e}")
+    if not path.parent.is_dir():
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            raise ValidationError(f"Cannot create output directory: {e}")
     
     # Check for valid filename
     if not path.name:
         raise ValidationError("Output path must include a filename")
     
     # Basic filename validation (no invalid characters)
-    invalid_chars = r'[<>:"|?*]'
-    if re.search(invalid_chars, path.name):
+    if len(path.name.translate(_INVALID_CHARS_TABLE)) != len(path.name):
         raise ValidationError("Filename contains invalid characters")
     
     return path
@@ -90,7 +106,7 @@ def validate_image_format(image_format: str) -> str:
     # Check if it's a key or value in SUPPORTED_IMAGE_FORMATS
     if image_format in SUPPORTED_IMAGE_FORMATS:
         return SUPPORTED_IMAGE_FORMATS[image_format]
-    elif image_format in SUPPORTED_IMAGE_FORMATS.values():
+    elif image_format in _IMAGE_FORMAT_CODES:
         return image_format
     else:
         supported = list(SUPPORTED_IMAGE_FORMATS.values())
@@ -114,7 +130,7 @@ def validate_archive_format(archive_format: Optional[str]) -> Optional[str]:
     if archive_format is None:
         return None
     
-    if archive_format not in SUPPORTED_ARCHIVE_FORMATS:
+    if archive_format not in _ARCHIVE_FORMATS:
         raise ValidationError(f"Unsupported archive format: {archive_format}. "
                             f"Supported formats: {SUPPORTED_ARCHIVE_FORMATS}")
     
@@ -125,30 +141,35 @@ def validate_buffer_size(buffer_size: Any) -> int:
     """
     Validate buffer size in bytes.
     
+    The size is rounded down to a multiple of BUFFER_ALIGNMENT and raised to
+    at least MIN_BUFFER_SIZE.
+    
     Args:
         buffer_size: Buffer size to validate
         
     Returns:
-        Validated buffer size in bytes
+        Validated, aligned buffer size in bytes
         
     Raises:
         ValidationError: If buffer size is invalid
     """
-    if buffer_size is None:
-        return 64 * 1024 * 1024  # Default 64MB
-    
-    try:
-        size = int(buffer_size)
-    except (ValueError, TypeError):
-        raise ValidationError("Buffer size must be an integer")
+    if isinstance(buffer_size, int):
+        size = buffer_size
+    elif buffer_size is None:
+        return DEFAULT_BUFFER_SIZE
+    else:
+        try:
+            size = int(buffer_size)
+        except (ValueError, TypeError):
+            raise ValidationError("Buffer size must be an integer")
     
     if size <= 0:
         raise ValidationError("Buffer size must be positive")
     
-    if size > 1024 * 1024 * 1024:  # 1GB limit
+    if size > BYTES_PER_GB:  # 1GB limit
         raise ValidationError("Buffer size too large (max 1GB)")
     
-    return size
+    return max(MIN_BUFFER_SIZE, size & ~(BUFFER_ALIGNMENT - 1))
 
 
 def sanitize_path_for_subprocess(path: str) -> str:
@@ -165,9 +186,10 @@ def sanitize_path_for_subprocess(path: str) -> str:
         ValidationError: If path contains dangerous characters
     """
     # Check for potential injection attempts
-    dangerous_chars = ['&', '|', ';', '$', '`', '(', ')', '{', '}']
-    for char in dangerous_chars:
-        if char in path:
-            raise ValidationError(f"Path contains potentially dangerous character: {char}")
+    bad_chars = _DANGEROUS_CHARS.intersection(path)
+    if bad_chars:
+        raise ValidationError(
+            f"Path contains potentially dangerous characters: {''.join(sorted(bad_chars))}"
+        )
     
     return path
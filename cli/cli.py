@@ -5,25 +5,24 @@ Provides a command-line interface for disk imaging operations.
 """
 import argparse
 import sys
+import time
 import logging
-from pathlib import Path
 from typing import Optional
 
 from backend import (
     AppConfig, list_disks, is_admin, require_admin, ImagingWorker,
     DiskImageError, ValidationError, SUPPORTED_IMAGE_FORMATS,
-    setup_logging
+    setup_logging, validate_output_path
 )
 
+# Minimum seconds between progress bar redraws
+PROGRESS_INTERVAL = 0.1
+
 
 def setup_cli_logging(verbose: bool = False) -> None:
     """Set up logging for CLI mode."""
     level = logging.DEBUG if verbose else logging.INFO
-    setup_logging(
-        log_level=level,
-        log_to_file=True,
-        log_to_console=True
-    )
+    setup_logging(level=level, console_output=True)
 
 
 def list_available_disks() -> None:
@@ -58,7 +57,6 @@ def create_disk_image(
     verbose: bool = False
 ) -> None:
     """Create a disk image with the specified parameters."""
-    setup_cli_logging(verbose)
     logger = logging.getLogger(__name__)
     
     try:
@@ -67,30 +65,30 @@ def create_disk_image(
             print("Error: Administrator privileges required for disk imaging.")
             sys.exit(1)
         
-        # Find the disk
+        # Find the disk by device ID or name (device IDs take precedence)
         disks = list_disks()
-        disk_info = None
-        for disk in disks:
-            if disk.get('id') == disk_id or disk.get('name') == disk_id:
-                disk_info = disk
-                break
+        disks_by_key = {disk.get('name'): disk for disk in disks}
+        disks_by_key.update({disk.get('device_id'): disk for disk in disks})
+        disk_info = disks_by_key.get(disk_id)
         
         if not disk_info:
             print(f"Error: Disk '{disk_id}' not found.")
             print("Use --list to see available disks.")
             sys.exit(1)
         
-        # Validate output path
-        output_path_obj = Path(output_path)
+        # Validate output path (resolves it and creates the directory if needed)
+        try:
+            output_path_obj = validate_output_path(output_path)
+        except ValidationError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        
         if output_path_obj.exists():
             response = input(f"Output file '{output_path}' exists. Overwrite? [y/N]: ")
             if response.lower() != 'y':
                 print("Operation cancelled.")
                 return
         
-        # Create output directory if needed
-        output_path_obj.parent.mkdir(parents=True, exist_ok=True)
-        
         print(f"Creating image of disk: {disk_info.get('name', 'Unknown')}")
         print(f"Output: {output_path}")
         print(f"Format: {image_format}")
@@ -103,13 +101,22 @@ def create_disk_image(
         # Create imaging worker
         worker = ImagingWorker()
         
-        # Define progress callback
+        # Define progress callback, throttled to ~10 redraws per second
+        last_update = 0.0
+        
         def progress_callback(progress: float) -> None:
+            nonlocal last_update
+            now = time.monotonic()
+            if now - last_update < PROGRESS_INTERVAL and progress < 100:
+                return
+            last_update = now
+            
             # Simple progress bar
             bar_length = 50
             filled = int(bar_length * progress / 100)
             bar = '█' * filled + '░' * (bar_length - filled)
-            print(f"\rProgress: [{bar}] {progress:.1f}%", end='', flush=True)
+            sys.stdout.write(f"\rProgress: [{bar}] {progress:.1f}%")
+            sys.stdout.flush()
         
         # Define log callback
         def log_callback(message: str) -> None:
@@ -256,6 +263,9 @@ Examples:
     if not args.output:
         parser.error("--output is required for imaging operations")
     
+    # Only set up file logging once an imaging job is actually requested
+    setup_cli_logging(args.verbose)
+    
     # Create disk image
     create_disk_image(
         disk_id=args.disk,
@@ -1,39 +1,55 @@
 """
 gui/gui.py - PyQt6 GUI entry point for DiskImage
 """
+import re
 import sys
+import time
 import logging
-import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, QPushButton, QComboBox, QLineEdit, QProgressBar, 
-    QFileDialog, QCheckBox, QMessageBox, QSpinBox, QTextEdit
+    QFileDialog, QCheckBox, QMessageBox, QSpinBox, QPlainTextEdit
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QAbstractListModel, QModelIndex
 
 # Use new backend classes
 from backend import (
-    AppConfig, list_disks, is_admin, require_admin, ImagingWorker,
-    DiskImageError, ValidationError, SUPPORTED_IMAGE_FORMATS
+    AppConfig, list_disks, clear_disk_list_cache, is_admin, require_admin,
+    ImagingWorker, DiskImageError, ValidationError, SUPPORTED_IMAGE_FORMATS
 )
 
 logger = logging.getLogger(__name__)
 
+# Progress signals are emitted at most this often (20 Hz), plus the final update
+PROGRESS_MIN_INTERVAL = 0.05  # seconds
+PROGRESS_MAXIMUM = 1000  # progress bar range, in permille
+STATUS_MAX_LINES = 2000  # scrollback kept in the status box
+
+# Fallback parser for display sizes such as "500 GB" or "1.5TB"
+_SIZE_RE = re.compile(r'^\s*([\d.]+)\s*([KMGTP]?B?)\s*$', re.IGNORECASE)
+_SIZE_MULTIPLIERS = {
+    # A bare number is taken as GB, the unit list_disks() reports
+    '': 1024**3, 'B': 1,
+    'K': 1024, 'M': 1024**2, 'G': 1024**3, 'T': 1024**4, 'P': 1024**5,
+    'KB': 1024, 'MB': 1024**2, 'GB': 1024**3, 'TB': 1024**4, 'PB': 1024**5,
+}
+
 
 class ImagingThread(QThread):
     """Worker thread for disk imaging operations using the new backend."""
     
-    progress = pyqtSignal(float)
+    progress = pyqtSignal(int)  # permille, 0..1000
     finished = pyqtSignal(bool, str)
     log = pyqtSignal(str)
 
     def __init__(self, disk_info: Dict[str, str], output_path: str, 
                  image_format: str, use_sparse: bool, use_compress: bool, 
                  archive_after: bool, archive_type: Optional[str], 
-                 buffer_size: int, cleanup_tools: bool):
+                 buffer_size: int, cleanup_tools: bool,
+                 imaging_worker: Optional[ImagingWorker] = None):
         super().__init__()
         self.disk_info = disk_info
         self.output_path = output_path
@@ -44,18 +60,39 @@ class ImagingThread(QThread):
         self.archive_type = archive_type
         self.buffer_size = buffer_size
         self.cleanup_tools = cleanup_tools
-        self.imaging_worker = ImagingWorker()
+        # Reuse the window's worker so tool lookups persist across jobs
+        self.imaging_worker = imaging_worker or ImagingWorker()
+        # Parsed once here rather than on every progress update
+        self._total_bytes = self._get_disk_size(disk_info)
 
     def run(self):
         """Run the imaging operation in a separate thread."""
         try:
+            # Precompute the bytes -> permille scale so each callback is one multiply
+            scale = PROGRESS_MAXIMUM / self._total_bytes if self._total_bytes > 0 else 0
+            last_emit = 0.0
+            last_permille = -1
+            
             def progress_callback(bytes_read: int) -> None:
-                total_size = self._get_disk_size(self.disk_info)
-                if total_size > 0:
-                    percent = (bytes_read / total_size) * 100
-                    self.progress.emit(min(percent, 100.0))
+                nonlocal last_emit, last_permille
+                if not scale:
+                    return
+                # The only clamp: keeps dedupe and the final-update check working
+                # when the reported disk size is smaller than what is actually read
+                permille = min(int(bytes_read * scale), PROGRESS_MAXIMUM)
+                if permille == last_permille:
+                    return
+                # Rate-limit emissions independently of the I/O completion rate
+                now = time.monotonic()
+                if now - last_emit < PROGRESS_MIN_INTERVAL and permille < PROGRESS_MAXIMUM:
+                    return
+                last_emit = now
+                last_permille = permille
+                self.progress.emit(permille)
+                if permille % 100 == 0 and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Progress: %.1f%%", permille * 0.1)
 
-            success, message, log_output = self.imaging_worker.run_imaging_job(
+            success, message, _ = self.imaging_worker.run_imaging_job(
                 disk_info=self.disk_info,
                 output_path=self.output_path,
                 image_format=self.image_format,
@@ -65,11 +102,12 @@ class ImagingThread(QThread):
                 archive_type=self.archive_type,
                 buffer_size=self.buffer_size,
                 cleanup_tools=self.cleanup_tools,
-                progress_callback=progress_callback
+                progress_callback=progress_callback,
+                log_callback=self.log.emit
             )
             
+            # Log lines were already streamed through log_callback
             self.finished.emit(success, message)
-            self.log.emit(log_output)
             
         except Exception as e:
             logger.exception("Imaging thread failed with exception")
@@ -78,24 +116,73 @@ class ImagingThread(QThread):
             self.finished.emit(False, error_msg)
             self.log.emit(traceback.format_exc())
 
-    def _get_disk_size(self, disk_info: Dict[str, str]) -> float:
+    def _get_disk_size(self, disk_info: Dict[str, Any]) -> float:
         """Extract disk size from disk info for progress calculation."""
-        try:
-            size_str = disk_info.get('size', '0 GB')
-            # Extract numeric part (e.g., "500 GB" -> "500")
-            size_parts = size_str.split()
-            if size_parts:
-                size_value = float(size_parts[0])
-                # Convert to bytes (assuming GB)
-                return size_value * (1024**3)
-        except (ValueError, IndexError) as e:
-            logger.warning(f"Could not parse disk size '{disk_info.get('size')}': {e}")
+        # Prefer the exact byte count reported by list_disks()
+        size_bytes = disk_info.get('size_bytes')
+        if size_bytes:
+            return float(size_bytes)
+        
+        size_str = disk_info.get('size', '0 GB')
+        match = _SIZE_RE.match(size_str)
+        if match:
+            try:
+                return float(match.group(1)) * _SIZE_MULTIPLIERS[match.group(2).upper()]
+            except ValueError:
+                pass
+        logger.warning(f"Could not parse disk size '{size_str}'")
         return 0.0
 
 
+class DiskListModel(QAbstractListModel):
+    """List model exposing disk dicts from list_disks() to the disk combo box."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._disks: List[Dict[str, Any]] = []
+    
+    def set_disks(self, disks: List[Dict[str, Any]]) -> None:
+        """Replace the disk list in a single model reset."""
+        self.beginResetModel()
+        self._disks = list(disks)
+        self.endResetModel()
+    
+    def disk(self, row: int) -> Optional[Dict[str, Any]]:
+        """Return the disk at row, or None if row is out of range."""
+        if 0 <= row < len(self._disks):
+            return self._disks[row]
+        return None
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._disks)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        disk = self.disk(index.row()) if index.isValid() else None
+        if disk is None:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Labels are formatted on demand; include interface type in display name
+            label = (f"{disk['name']} ({disk['device_id']}) - {disk['size']} - "
+                     f"{disk['model']} [{disk.get('interface', 'Unknown')}]")
+            media_type = disk.get('media_type', 'Unknown')
+            if media_type != 'Unknown':
+                label += f" {media_type}"
+            return label
+        if role == Qt.ItemDataRole.UserRole:
+            return disk
+        return None
+
+
 class DiskImagerWindow(QMainWindow):
     """Main GUI window for the DiskImage application."""
     
+    # Save dialog filter, built once from the supported formats
+    IMAGE_FILE_FILTER = (
+        "All Supported ("
+        + " ".join(f"*.{ext}" for ext in SUPPORTED_IMAGE_FORMATS.values())
+        + ");;All Files (*)"
+    )
+    
     def __init__(self):
         super().__init__()
         try:
@@ -108,7 +195,10 @@ class DiskImagerWindow(QMainWindow):
         w, h = self.config.window_size
         self.setGeometry(100, 100, w, h)
         self.selected_disk: Optional[Dict[str, str]] = None
+        self.disk_model = DiskListModel(self)
         self.imaging_thread: Optional[ImagingThread] = None
+        self.imaging_worker = ImagingWorker()
+        self.current_format: Optional[str] = None
         
         self.init_ui()
         self.refresh_disks()
@@ -122,9 +212,15 @@ class DiskImagerWindow(QMainWindow):
         
         # Disk selection
         layout.addWidget(QLabel("Select Disk:"))
+        disk_layout = QHBoxLayout()
         self.disk_combo = QComboBox()
+        self.disk_combo.setModel(self.disk_model)
         self.disk_combo.currentIndexChanged.connect(self.on_disk_selected)
-        layout.addWidget(self.disk_combo)
+        disk_layout.addWidget(self.disk_combo, 1)
+        self.refresh_btn = QPushButton("Refresh")
+        self.refresh_btn.clicked.connect(self.on_refresh_clicked)
+        disk_layout.addWidget(self.refresh_btn)
+        layout.addLayout(disk_layout)
         
         # Output file
         out_layout = QHBoxLayout()
@@ -142,6 +238,8 @@ class DiskImagerWindow(QMainWindow):
         self.format_combo = QComboBox()
         for label, format_code in SUPPORTED_IMAGE_FORMATS.items():
             self.format_combo.addItem(label, format_code)
+        self.format_combo.currentIndexChanged.connect(self.on_format_selected)
+        self.current_format = self.format_combo.currentData()
         fmt_layout.addWidget(self.format_combo)
         layout.addLayout(fmt_layout)
         
@@ -177,12 +275,13 @@ class DiskImagerWindow(QMainWindow):
         
         # Progress
         self.progress = QProgressBar()
-        self.progress.setRange(0, 100)
+        self.progress.setRange(0, PROGRESS_MAXIMUM)
         layout.addWidget(self.progress)
         
-        # Status (use QTextEdit for copyable text)
-        self.status_label = QTextEdit("Ready.")
+        # Status (plain text: copyable, cheap appends, bounded scrollback)
+        self.status_label = QPlainTextEdit("Ready.")
         self.status_label.setReadOnly(True)
+        self.status_label.setMaximumBlockCount(STATUS_MAX_LINES)
         self.status_label.setMaximumHeight(120)
         layout.addWidget(self.status_label)
         
@@ -211,48 +310,64 @@ class DiskImagerWindow(QMainWindow):
             logger.error(f"Failed to save configuration: {e}")        
         event.accept()
 
+    def on_refresh_clicked(self):
+        """Handle the Refresh button: discard the cached disk list and re-enumerate."""
+        clear_disk_list_cache()
+        self.refresh_disks()
+
     def refresh_disks(self):
-        """Refresh the list of available disks."""
+        """
+        Re-enumerate the available disks.
+        
+        Disk enumeration is slow on Windows, so it only runs at startup and
+        when the user presses Refresh; the combo box shows the disk model,
+        which formats its labels on demand.
+        """
         try:
-            disks = list_disks()
-            self.disks = disks
-            self.disk_combo.clear()
-            
-            if not disks:
-                self.disk_combo.addItem("No disks found")
-                self.start_btn.setEnabled(False)
-            else:
-                for disk in disks:
-                    # Include interface type in display name
-                    interface = disk.get('interface', 'Unknown')
-                    display_name = f"{disk['name']} ({disk['device_id']}) - {disk['size']} - {disk['model']} [{interface}]"
-                    self.disk_combo.addItem(display_name)
-                self.selected_disk = disks[0]
-                self.start_btn.setEnabled(True)
+            self.disk_model.set_disks(list_disks())
+            self._populate_disk_combo()
                 
         except Exception as e:
             logger.error(f"Failed to refresh disks: {e}")
-            self.disk_combo.clear()
-            self.disk_combo.addItem("Error loading disks")
-            self.start_btn.setEnabled(False)
+            self.disk_model.set_disks([])
+            self._populate_disk_combo("Error loading disks")
+
+    def _populate_disk_combo(self, empty_text: str = "No disks found"):
+        """Select the first disk in the model, or show empty_text if there are none."""
+        if self.disk_model.rowCount() == 0:
+            self.selected_disk = None
+            self.disk_combo.setPlaceholderText(empty_text)
+            self.disk_combo.setCurrentIndex(-1)
+        else:
+            self.disk_combo.setCurrentIndex(0)
+            self.selected_disk = self.disk_model.disk(0)
+        # A running job owns the Start button until on_imaging_finished
+        if self.imaging_thread is None or not self.imaging_thread.isRunning():
+            self.start_btn.setEnabled(self.selected_disk is not None)
 
     def on_disk_selected(self, index: int):
         """Handle disk selection change."""
-        if hasattr(self, 'disks') and 0 <= index < len(self.disks):
-            self.selected_disk = self.disks[index]
+        self.selected_disk = self.disk_model.disk(index)
+
+    def on_format_selected(self, index: int):
+        """Cache the format code for the selected image format."""
+        self.current_format = self.format_combo.itemData(index)
 
     def browse_file(self):
         """Open file dialog to select output file."""
         try:
             if self.selected_disk:
-                current_format = self.format_combo.currentData()
-                default_name = f"{self.selected_disk['name']}_{datetime.datetime.now().strftime('%Y%m%d')}.{current_format}"
+                default_name = f"{self.selected_disk['name']}_{time.strftime('%Y%m%d')}.{self.current_format}"
                 
+                # The native dialog can stall enumerating mapped network drives
+                options = (QFileDialog.Option.DontUseNativeDialog
+                           if self.config.use_qt_dialog else QFileDialog.Option(0))
                 file_path, _ = QFileDialog.getSaveFileName(
                     self, 
                     "Save Image File", 
                     default_name,
-                    "All Supported (*.img *.vhd *.vmdk *.qcow2 *.iso);;All Files (*)"
+                    self.IMAGE_FILE_FILTER,
+                    options=options
                 )
                 
                 if file_path:
@@ -276,7 +391,12 @@ class DiskImagerWindow(QMainWindow):
             if not output_path:
                 QMessageBox.critical(self, "Error", "Please specify an output file.")
                 return
-                
+
+            image_format = self.current_format
+            if not image_format:
+                QMessageBox.critical(self, "Error", "Please select an image format.")
+                return
+
             # Check if file exists
             output_file = Path(output_path)
             if output_file.exists():
@@ -289,7 +409,6 @@ class DiskImagerWindow(QMainWindow):
                     return
             
             # Get settings
-            image_format = self.format_combo.currentData()
             use_sparse = self.sparse_cb.isChecked()
             use_compress = self.compress_cb.isChecked()
             archive_after = self.archive_cb.isChecked()
@@ -299,15 +418,16 @@ class DiskImagerWindow(QMainWindow):
             
             # Reset UI for imaging
             self.progress.setValue(0)
-            self.progress.setMaximum(100)
+            self.progress.setMaximum(PROGRESS_MAXIMUM)
             self.status_label.setPlainText("Imaging in progress...")
             self.start_btn.setEnabled(False)
+            self.refresh_btn.setEnabled(False)
             
             # Start imaging thread
             self.imaging_thread = ImagingThread(
                 self.selected_disk, output_path, image_format,
                 use_sparse, use_compress, archive_after, archive_type,
-                buffer_size, cleanup_tools
+                buffer_size, cleanup_tools, self.imaging_worker
             )
             
             self.imaging_thread.progress.connect(self.update_progress)
@@ -318,28 +438,30 @@ class DiskImagerWindow(QMainWindow):
         except Exception as e:
             logger.exception("Failed to start imaging")
             QMessageBox.critical(self, "Error", f"Failed to start imaging: {e}")
-            self.start_btn.setEnabled(True)
+            self.start_btn.setEnabled(self.selected_disk is not None)
+            self.refresh_btn.setEnabled(True)
 
-    def update_progress(self, percent: float):
-        """Update the progress bar."""
+    def update_progress(self, permille: int):
+        """Update the progress bar (ImagingThread already clamps to the bar's range)."""
         try:
-            value = int(max(0, min(100, percent)))
-            self.progress.setValue(value)
+            self.progress.setValue(permille)
         except Exception as e:
             logger.warning(f"Failed to update progress: {e}")
 
     def append_log(self, text: str):
         """Append text to the log display."""
         if text:
-            self.status_label.append(text)
+            self.status_label.appendPlainText(text)
 
     def on_imaging_finished(self, success: bool, message: str):
         """Handle completion of imaging operation."""
-        self.status_label.setPlainText(message)
-        self.start_btn.setEnabled(True)
+        # Append so the log lines streamed during the job stay visible
+        self.status_label.appendPlainText(message)
+        self.start_btn.setEnabled(self.selected_disk is not None)
+        self.refresh_btn.setEnabled(True)
         
         if not success and 'Could not open' in message and 'PhysicalDrive' in message:
-            self.status_label.append(
+            self.status_label.appendPlainText(
                 "\nHint: The selected physical drive may not exist, is in use, "
                 "or requires administrator privileges. Make sure the drive is "
                 "present and not locked by another process."
@@ -11,14 +11,15 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from backend.app import run_app
-from cli.cli import main as cli_main
-
 
 def main():
     """Main entry point - routes to CLI or GUI based on arguments."""
+    # Entry points are imported only for the mode that runs, so CLI
+    # invocations such as --help don't pay for the GUI startup path.
+
     # If no arguments provided, launch GUI
     if len(sys.argv) == 1:
+        from backend.app import run_app
         run_app()
         return
     
@@ -27,10 +28,12 @@ def main():
     if len(sys.argv) > 1 and sys.argv[1] in gui_flags:
         # Remove the GUI flag and launch GUI
         sys.argv.pop(1)
+        from backend.app import run_app
         run_app()
         return
     
     # Otherwise, use CLI
+    from cli.cli import main as cli_main
     cli_main()
 
 
@@ -8,24 +8,87 @@ and development tools.
 import subprocess
 import sys
 import platform
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
+# pip install without the PyPI self-version check or interactive prompts
+PIP_INSTALL = [sys.executable, "-m", "pip", "install",
+               "--disable-pip-version-check", "--no-input"]
 
-def run_command(command, description=""):
-    """Run a command and handle errors."""
+# Independent checks run after setup, in report order:
+# (heading, command, warning printed on failure)
+CHECKS = [
+    ("Running initial tests",
+     [sys.executable, "-m", "pytest", "tests/", "-v"],
+     "Warning: Some tests failed"),
+    ("Running type checking",
+     ["mypy", "backend/", "cli/", "gui/", "--ignore-missing-imports"],
+     "Warning: Type checking found issues"),
+    ("Checking code formatting",
+     ["black", "--check", "."],
+     "Warning: Code formatting issues found. Run 'black .' to fix."),
+    ("Checking import sorting",
+     ["isort", "--check-only", "--diff", "."],
+     "Warning: Import sorting issues found. Run 'isort .' to fix."),
+]
+
+
+def run_command(command, description="", stream=False):
+    """Run a command and handle errors.
+
+    With stream=True the command's combined output is echoed line by line as
+    it is produced instead of being buffered until the command exits.
+    """
     print(f"Running: {' '.join(command)}")
     if description:
         print(f"  {description}")
     
+    if stream:
+        return _run_streamed(command)
+    
+    success, report = _run_captured(command)
+    for line in report:
+        print(line)
+    return success
+
+
+def _run_captured(command):
+    """Run a command to completion and return (success, report lines).
+
+    Nothing is printed, so several commands can run at once and have their
+    reports printed afterwards in a fixed order.
+    """
+    report = []
     try:
         result = subprocess.run(command, check=True, capture_output=True, text=True)
         if result.stdout:
-            print(f"  Output: {result.stdout.strip()}")
-        return True
+            report.append(f"  Output: {result.stdout.strip()}")
+        return True, report
     except subprocess.CalledProcessError as e:
-        print(f"  Error: {e}")
+        report.append(f"  Error: {e}")
         if e.stderr:
-            print(f"  Stderr: {e.stderr.strip()}")
+            report.append(f"  Stderr: {e.stderr.strip()}")
+        return False, report
+    except OSError as e:
+        # e.g. the tool is not installed
+        report.append(f"  Error: {e}")
+        return False, report
+
+
+def _run_streamed(command):
+    """Run a command, echoing its output as it arrives."""
+    try:
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, bufsize=1) as process:
+            for line in process.stdout:
+                print(f"  {line.rstrip()}", flush=True)
+        if process.returncode != 0:
+            print(f"  Error: command exited with status {process.returncode}")
+            return False
+        return True
+    except OSError as e:
+        print(f"  Error: {e}")
         return False
 
 
@@ -38,13 +101,13 @@ def setup_development_environment():
     
     # Upgrade pip
     print("1. Upgrading pip...")
-    if not run_command([sys.executable, "-m", "pip", "install", "--upgrade", "pip"]):
+    if not run_command(PIP_INSTALL + ["--upgrade", "pip"], stream=True):
         print("Failed to upgrade pip")
         return False
     
     # Install requirements
     print("\n2. Installing requirements...")
-    if not run_command([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"]):
+    if not run_command(PIP_INSTALL + ["-r", "requirements.txt"], stream=True):
         print("Failed to install requirements")
         return False
     
@@ -57,7 +120,12 @@ def setup_development_environment():
     ]
     
     for tool in dev_tools:
-        if not run_command([sys.executable, "-m", "pip", "install", tool]):
+        try:
+            print(f"{tool} {version(tool)} already installed")
+            continue
+        except PackageNotFoundError:
+            pass
+        if not run_command(PIP_INSTALL + [tool], stream=True):
             print(f"Warning: Failed to install {tool}")
     
     # Setup pre-commit hooks
@@ -65,25 +133,18 @@ def setup_development_environment():
     if not run_command(["pre-commit", "install"]):
         print("Warning: Failed to setup pre-commit hooks")
     
-    # Run initial tests
-    print("\n5. Running initial tests...")
-    if not run_command([sys.executable, "-m", "pytest", "tests/", "-v"]):
-        print("Warning: Some tests failed")
-    
-    # Type checking
-    print("\n6. Running type checking...")
-    if not run_command(["mypy", "backend/", "cli/", "gui/", "--ignore-missing-imports"]):
-        print("Warning: Type checking found issues")
-    
-    # Code formatting check
-    print("\n7. Checking code formatting...")
-    if not run_command(["black", "--check", "."]):
-        print("Warning: Code formatting issues found. Run 'black .' to fix.")
-    
-    # Import sorting check
-    print("\n8. Checking import sorting...")
-    if not run_command(["isort", "--check-only", "--diff", "."]):
-        print("Warning: Import sorting issues found. Run 'isort .' to fix.")
+    # Tests, type checking and lint checks don't depend on each other: run
+    # them concurrently and print each report in order once it is done
+    with ThreadPoolExecutor(max_workers=len(CHECKS)) as executor:
+        futures = [executor.submit(_run_captured, command) for _, command, _ in CHECKS]
+        for number, ((heading, command, warning), future) in enumerate(zip(CHECKS, futures), 5):
+            print(f"\n{number}. {heading}...")
+            print(f"Running: {' '.join(command)}")
+            success, report = future.result()
+            for line in report:
+                print(line)
+            if not success:
+                print(warning)
     
     print("\n" + "="*60)
     print("Development environment setup complete!")
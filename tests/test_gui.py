@@ -0,0 +1,32 @@
+"""Tests for the GUI's disk size fallback parser."""
+import pytest
+
+pytest.importorskip("PyQt6.QtCore")
+
+from gui.gui import ImagingThread  # noqa: E402
+
+
+def _parse(size: str) -> float:
+    # _get_disk_size doesn't touch self, so no thread needs constructing
+    return ImagingThread._get_disk_size(None, {'size': size})  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("size, expected", [
+    ("512 B", 512.0),
+    ("512b", 512.0),
+    ("4 KB", 4 * 1024.0),
+    ("1.5TB", 1.5 * 1024**4),
+    ("500 G", 500 * 1024.0**3),
+    ("500", 500 * 1024.0**3),
+])
+def test_get_disk_size_parses_display_sizes(size: str, expected: float) -> None:
+    assert _parse(size) == expected
+
+
+def test_get_disk_size_prefers_size_bytes() -> None:
+    info = {'size': '1 GB', 'size_bytes': 1000}
+    assert ImagingThread._get_disk_size(None, info) == 1000.0  # type: ignore[arg-type]
+
+
+def test_get_disk_size_unparseable_is_zero() -> None:
+    assert _parse("unknown") == 0.0